@@ -1,9 +1,13 @@
 import streamlit as st
-import json
+import orjson
+import pandas as pd
+import numpy as np
 import os
-from pathlib import Path
-import time
-from datetime import datetime
+import tempfile
+import math
+import functools
+import html
+from datetime import date, datetime
 
 # Page configuration
 st.set_page_config(
@@ -14,7 +18,7 @@ st.set_page_config(
 )
 
 # Custom CSS for styling
-st.markdown("""
+_CSS = """
 <style>
     .main {
         background-color: #0a1929;
@@ -40,6 +44,14 @@ st.markdown("""
         border: 2px solid #2196f3;
         box-shadow: 0 4px 6px rgba(33, 150, 243, 0.3);
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .metric-row > .metric-card {
+        flex: 1;
+    }
     .result-value {
         font-size: 2.5rem;
         font-weight: bold;
@@ -76,100 +88,224 @@ st.markdown("""
         border-left: 4px solid #4caf50;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted every run (elements not re-emitted are dropped); st.html skips the markdown parser
+st.html(_CSS)
 
 # Data management
 DATA_FILE = 'dva_data.json'
+PROJECTS_FILE = 'dva_projects.json'
 
-def load_data():
+def file_mtime(path):
+    """Return file modification time, or None if the file doesn't exist"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+def read_json_list(path):
+    """Read a JSON list from file, returning an empty list if missing, empty or corrupted"""
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return []
+    if not content.strip():
+        return []
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # If JSON is corrupted, return empty list
+        return []
+
+# Loaders are keyed on (path, mtime) so reruns hit the cache until the file changes on disk
+@st.cache_data(show_spinner=False)
+def load_data(path, mtime):
     """Load sample data from JSON file"""
-    if os.path.exists(DATA_FILE):
-        try:
-            with open(DATA_FILE, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-                else:
-                    return []
-        except (json.JSONDecodeError, ValueError):
-            # If JSON is corrupted, return empty list
-            return []
-    return []
+    return read_json_list(path)
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD string to a date; other stored values are kept as-is so saving doesn't drop them"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value or None
+
+def format_date(value):
+    """Display text for a project date, which may be a date or an unparsed stored value"""
+    if value is None:
+        return ''
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+@st.cache_data(show_spinner=False)
+def load_projects(path, mtime):
+    """Load projects from JSON file, with dates parsed once here rather than on every use"""
+    projects = read_json_list(path)
+    for project in projects:
+        project['date'] = parse_date(project.get('date'))
+    return projects
+
+# Mode open() would give a new file; read once at import since os.umask can only be queried by setting it
+_umask = os.umask(0)
+os.umask(_umask)
+NEW_FILE_MODE = 0o666 & ~_umask
+
+def write_json_atomic(path, data):
+    """Write compact JSON to a temp file and swap it into place, so readers never see a partial file"""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+    # Unique temp file per write, so concurrent sessions never share one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        # mkstemp creates the file owner-only; keep the target's permissions instead
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 def save_data(samples):
     """Save sample data to JSON file"""
     try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(samples, f, indent=2)
+        write_json_atomic(DATA_FILE, samples)
     except Exception as e:
         st.error(f"Error saving data: {str(e)}")
 
 def initialize_data():
     """Initialize with sample data if file doesn't exist"""
-    if not os.path.exists(DATA_FILE):
-        sample_data = [
-            {'id': 'Sample-001', 'weight': 150, 'unit': 'grams'},
-            {'id': 'Sample-002', 'weight': 5.5, 'unit': 'ounces'},
-            {'id': 'Sample-003', 'weight': 2.3, 'unit': 'pounds'},
-            {'id': 'Sample-004', 'weight': 0.75, 'unit': 'kilograms'},
-            {'id': 'Sample-005', 'weight': 250, 'unit': 'grams'}
-        ]
-        save_data(sample_data)
+    sample_data = [
+        {'id': 'Sample-001', 'weight': 150, 'unit': 'grams'},
+        {'id': 'Sample-002', 'weight': 5.5, 'unit': 'ounces'},
+        {'id': 'Sample-003', 'weight': 2.3, 'unit': 'pounds'},
+        {'id': 'Sample-004', 'weight': 0.75, 'unit': 'kilograms'},
+        {'id': 'Sample-005', 'weight': 250, 'unit': 'grams'}
+    ]
+    try:
+        # Exclusive create: fails instead of overwriting an existing file
+        with open(DATA_FILE, 'xb') as f:
+            f.write(orjson.dumps(sample_data))
+    except FileExistsError:
+        pass
+    except Exception as e:
+        st.error(f"Error saving data: {str(e)}")
+
+# Existing Samples rows shown per page
+SAMPLES_PAGE_SIZE = 25
+
+# Volume of water per unit of weight: (mm³, cm³, in³)
+VOLUME_CONVERSIONS = {
+    'grams': (1000, 1, 0.061023744),
+    'ounces': (28316.8466, 28.3168466, 1.7295904),
+    'pounds': (453592.37, 453.59237, 27.6806742),
+    'kilograms': (1000000, 1000, 61.023744)
+}
+
+# Length units to mm (base unit)
+DIMENSION_TO_MM = {
+    "mm": 1,
+    "cm": 10,
+    "inches": 25.4,
+    "feet": 304.8
+}
+DIMENSION_TO_MM3 = {unit: factor ** 3 for unit, factor in DIMENSION_TO_MM.items()}
+
+# Conversion factors from mm³
+MM3_TO_UNIT = {
+    "cubic mm": 1,
+    "cubic cm": 0.001,
+    "cubic inches": 0.000061023744,
+    "cubic feet": 0.000000035315
+}
+
+# Volume efficiency bands: reaching each threshold (% of box used) moves up one band
+EFFICIENCY_THRESHOLDS = (40, 60, 80)
+# Past 100% the product doesn't fit, which gets its own band after the others
+EFFICIENCY_LEVELS = ('Low', 'Moderate', 'Good', 'Excellent', 'Overflow')
+EFFICIENCY_COLORS = ('#ff9800', '#ffc107', '#8bc34a', '#4caf50', '#f44336')  # Orange, yellow, light green, green, red
+EFFICIENCY_DELTA_COLORS = ('inverse', 'off', 'normal', 'normal', 'inverse')
+OVERFLOW_BAND = len(EFFICIENCY_LEVELS) - 1
+
+# Space status bands by % of box remaining
+SPACE_THRESHOLDS = (5, 20)
+SPACE_STATUS = ('❌ Too Full', '⚠️ Tight Fit', '✅ Good Space')
+
+def efficiency_band(percentage_used):
+    """Index into the EFFICIENCY_* tables for a used percentage, or an array of them"""
+    band = np.searchsorted(EFFICIENCY_THRESHOLDS, percentage_used, side='right')
+    return np.where(np.asarray(percentage_used) > 100, OVERFLOW_BAND, band)[()]
+
+def space_band(percentage_remaining):
+    """Index into SPACE_STATUS for a remaining percentage, or an array of them"""
+    return np.searchsorted(SPACE_THRESHOLDS, percentage_remaining, side='right')
 
+# Pure functions of their inputs, memoized so unrelated reruns skip the math.
+# calculate_volume is also hit once per overview/report project, hence the larger cache.
+@functools.lru_cache(maxsize=1024)
 def calculate_volume(weight, unit):
-    """Calculate volume conversions"""
-    conversions = {
-        'grams': {'mm³': 1000, 'cm³': 1, 'in³': 0.061023744},
-        'ounces': {'mm³': 28316.8466, 'cm³': 28.3168466, 'in³': 1.7295904},
-        'pounds': {'mm³': 453592.37, 'cm³': 453.59237, 'in³': 27.6806742},
-        'kilograms': {'mm³': 1000000, 'cm³': 1000, 'in³': 61.023744}
-    }
-    
-    results = conversions[unit]
-    return {
-        'mm³': weight * results['mm³'],
-        'cm³': weight * results['cm³'],
-        'in³': weight * results['in³']
-    }
+    """Calculate volume conversions as (mm³, cm³, in³)"""
+    mm3, cm3, in3 = VOLUME_CONVERSIONS[unit]
+    return weight * mm3, weight * cm3, weight * in3
+
+def last_result(name, func, *args):
+    """Return func(*args), reusing the session's previous result while the inputs are unchanged"""
+    cached = st.session_state.get(name)
+    if cached is None or cached[0] != args:
+        cached = (args, func(*args))
+        st.session_state[name] = cached
+    return cached[1]
+
+# Factor table rows follow VOLUME_CONVERSIONS order, indexed by unit code
+VOLUME_FACTORS = np.array(list(VOLUME_CONVERSIONS.values()), dtype=float)
+UNIT_CODES = {unit: code for code, unit in enumerate(VOLUME_CONVERSIONS)}
+
+def calculate_volumes_batch(weights, units):
+    """Calculate volume conversions for many samples at once as an (n, 3) array of (mm³, cm³, in³)"""
+    codes = np.fromiter((UNIT_CODES[unit] for unit in units), dtype=np.intp, count=len(units))
+    return np.asarray(weights, dtype=float)[:, np.newaxis] * VOLUME_FACTORS[codes]
+
+@functools.lru_cache(maxsize=128)
+def calculate_box(length, width, height, dimension_unit):
+    """Calculate box volume in mm³ (base unit)"""
+    return length * width * height * DIMENSION_TO_MM3[dimension_unit]
 
 def ensure_valid_json_file(filename, default_data=None):
     """Ensure JSON file exists and is valid"""
     if default_data is None:
         default_data = []
     
-    if not os.path.exists(filename):
-        # Create file with default data
-        try:
-            with open(filename, 'w') as f:
-                json.dump(default_data, f, indent=2)
-        except:
-            pass
-    else:
+    try:
+        with open(filename, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = b''
+    
+    if content.strip():
         # Validate existing file
         try:
-            with open(filename, 'r') as f:
-                content = f.read().strip()
-                if not content:
-                    # Empty file, write default
-                    with open(filename, 'w') as f:
-                        json.dump(default_data, f, indent=2)
-                else:
-                    # Try to parse
-                    json.loads(content)
-        except (json.JSONDecodeError, ValueError):
-            # Corrupted file, backup and recreate
+            orjson.loads(content)
+            return
+        except orjson.JSONDecodeError:
+            # Corrupted file, backup before recreating
             try:
-                if os.path.exists(filename):
-                    os.rename(filename, f"{filename}.backup")
-            except:
+                os.replace(filename, f"{filename}.backup")
+            except OSError:
                 pass
-            with open(filename, 'w') as f:
-                json.dump(default_data, f, indent=2)
+    
+    # Missing, empty or corrupted file: write default data once
+    try:
+        write_json_atomic(filename, default_data)
+    except OSError:
+        pass
 
 # Initialize session state
 if 'samples' not in st.session_state:
     initialize_data()
-    st.session_state.samples = load_data()
+    st.session_state.samples = load_data(DATA_FILE, file_mtime(DATA_FILE))
 
 if 'show_success' not in st.session_state:
     st.session_state.show_success = False
@@ -190,42 +326,36 @@ with col2:
 
 st.markdown("---")
 
+def rebuild_project_index():
+    """Map project numbers to their position in the projects list"""
+    st.session_state.project_index = {p['project_number']: i for i, p in enumerate(st.session_state.projects)}
+
 # Initialize session state for projects
 if 'projects' not in st.session_state:
-    st.session_state.projects = []
-    
     # Ensure JSON file is valid before trying to load
-    ensure_valid_json_file('dva_projects.json', [])
+    ensure_valid_json_file(PROJECTS_FILE, [])
     
-    # Load projects from file if exists
-    if os.path.exists('dva_projects.json'):
-        try:
-            with open('dva_projects.json', 'r') as f:
-                content = f.read().strip()
-                if content:  # Check if file is not empty
-                    st.session_state.projects = json.loads(content)
-                else:
-                    st.session_state.projects = []
-        except (json.JSONDecodeError, ValueError) as e:
-            # If JSON is corrupted, start with empty list and backup bad file
-            st.session_state.projects = []
-            # Optionally backup the corrupted file
-            if os.path.exists('dva_projects.json'):
-                try:
-                    os.rename('dva_projects.json', 'dva_projects.json.backup')
-                except:
-                    pass
+    # Load projects from file
+    st.session_state.projects = load_projects(PROJECTS_FILE, file_mtime(PROJECTS_FILE))
+    st.session_state.projects_dirty = False
+    st.session_state.projects_df = None
+    st.session_state.projects_version = 0
+    rebuild_project_index()
+
+# Projects added to the overview, keyed by project number
+if 'loaded_projects_overview' not in st.session_state:
+    st.session_state.loaded_projects_overview = {}
+
+# Overview projects with box data, kept in step with the overview for the comparison
+if 'overview_with_boxes' not in st.session_state:
+    st.session_state.overview_with_boxes = {}
 
 if 'current_project_id' not in st.session_state:
     st.session_state.current_project_id = None
 
 if 'project_counter' not in st.session_state:
-    # Initialize counter from existing projects or start at 1000
-    if st.session_state.projects:
-        max_id = max([p['project_number'] for p in st.session_state.projects])
-        st.session_state.project_counter = max_id + 1
-    else:
-        st.session_state.project_counter = 1000
+    # Initialize counter from existing project numbers (already indexed) or start at 1000
+    st.session_state.project_counter = max(st.session_state.project_index, default=999) + 1
 
 # Initialize with default values on first load
 if 'app_initialized' not in st.session_state:
@@ -243,11 +373,178 @@ if 'app_initialized' not in st.session_state:
     st.session_state.dimension_unit = 'cm'
     st.session_state.box_result_unit = 'cubic cm'
 
+# Project record field -> (session state key, default)
+PROJECT_FIELDS = {
+    'project_name': ('project_name', ''),
+    'designer': ('designer', ''),
+    'description': ('project_description', ''),
+    'contact': ('contact_info', ''),
+    # Primary product data
+    'weight': ('primary_weight', 0.0),
+    'weight_unit': ('primary_unit', 'grams'),
+    'primary_volume_mm3': ('primary_volume_mm3', 0.0),
+    # Box data
+    'box_length': ('box_length', 0.0),
+    'box_width': ('box_width', 0.0),
+    'box_height': ('box_height', 0.0),
+    'dimension_unit': ('dimension_unit', 'cm'),
+    'box_result_unit': ('box_result_unit', 'cubic cm'),
+    'box_volume_mm3': ('box_volume_mm3', 0.0)
+}
+
+def mark_projects_changed():
+    """Flag the project list as needing a save and its table view as stale"""
+    st.session_state.projects_dirty = True
+    st.session_state.projects_df = None
+    # New table key: the browser would otherwise keep selecting rows by their old positions
+    st.session_state.projects_version += 1
+
+def add_to_overview(project):
+    """Add a project to the overview; returns False if it was already there"""
+    project_number = project['project_number']
+    if project_number in st.session_state.loaded_projects_overview:
+        return False
+    st.session_state.loaded_projects_overview[project_number] = project
+    if project.get('box_volume_mm3', 0) > 0:
+        st.session_state.overview_with_boxes[project_number] = project
+    return True
+
+def remove_from_overview(project_number):
+    """Drop a project from the overview"""
+    st.session_state.loaded_projects_overview.pop(project_number, None)
+    st.session_state.overview_with_boxes.pop(project_number, None)
+
+def clear_overview():
+    """Empty the overview"""
+    st.session_state.loaded_projects_overview = {}
+    st.session_state.overview_with_boxes = {}
+
+def truncate(text, length=50, suffix='...'):
+    """Shorten text to length characters, adding suffix when cut"""
+    return text if len(text) <= length else text[:length] + suffix
+
+def build_project_display(projects):
+    """Build the Project Results summary table"""
+    display_df = pd.DataFrame.from_records(
+        [
+            (
+                project['project_number'],
+                project['project_name'],
+                project['designer'],
+                truncate(project['description']),
+                project['date']
+            )
+            for project in projects
+        ],
+        columns=['Project #', 'Project Name', 'Designer', 'Description', 'Date']
+    )
+    # Dates stored in other formats are parsed for display where possible, blank otherwise
+    display_df['Date'] = pd.to_datetime(display_df['Date'], errors='coerce', format='mixed')
+    return display_df.convert_dtypes(dtype_backend='pyarrow')  # Arrow-backed columns hand off to st.dataframe without object boxing
+
+# Column layouts for the project summary and overview tables, built once at import
+PROJECT_COLUMN_CONFIG = {
+    "Project #": st.column_config.NumberColumn(
+        "Project #",
+        width="small",  # Optimized to fit project number
+    ),
+    "Project Name": st.column_config.TextColumn(
+        "Project Name",
+        width="medium",
+    ),
+    "Designer": st.column_config.TextColumn(
+        "Designer",
+        width="small",
+    ),
+    "Description": st.column_config.TextColumn(
+        "Description",
+        width="large",
+    ),
+    "Date": st.column_config.DateColumn(
+        "Date",
+        width="small",
+    ),
+}
+
+OVERVIEW_COLUMN_CONFIG = {
+    "Remove": st.column_config.CheckboxColumn(
+        "Remove",
+        help="Remove from Overview",
+        width="small",
+    ),
+}
+
+COMPARISON_COLUMN_CONFIG = {
+    "Project #": st.column_config.NumberColumn("Project #", width="small"),
+    "Box Volume": st.column_config.NumberColumn("Box Volume", format="%.2f"),
+    "Product Volume": st.column_config.NumberColumn("Product Volume", format="%.2f"),
+    "Remaining": st.column_config.NumberColumn(
+        "Remaining",
+        help="Negative when the product overflows the box",
+        format="%.2f",
+    ),
+    "Efficiency": st.column_config.ProgressColumn(
+        "Efficiency",
+        help="Share of the box volume used by the product",
+        format="%.1f%%",
+        min_value=0,
+        max_value=100,
+    ),
+}
+
+# Overview details panel, one HTML block per project. Kept unindented and without
+# blank lines so markdown passes it through as a single HTML block.
+OVERVIEW_TEMPLATE = """<div class="metric-row">
+<div class="metric-card">
+<h4>Project Information</h4>
+<b>Project Number:</b> {project_number}<br>
+<b>Project Name:</b> {project_name}<br>
+<b>Designer:</b> {designer}<br>
+<b>Date:</b> {date}<br>
+<b>Contact:</b> {contact}<br>
+<b>Description:</b> {description}
+</div>
+<div class="metric-card">
+<h4>Calculation Results</h4>
+<b>Primary Product:</b><br>
+Weight: {weight} {weight_unit}<br><br>
+<b>Volumes:</b><br>
+• {volume_mm3:,.2f} mm³<br>
+• {volume_cm3:,.2f} cm³<br>
+• {volume_in3:,.3f} in³
+{box}</div>
+</div>"""
+
+OVERVIEW_BOX_TEMPLATE = """<br><br><b>Secondary Packaging:</b><br>
+Dimensions: {box_length} × {box_width} × {box_height} {dimension_unit}<br>
+Box Volume: {box_volume_mm3:,.2f} mm³
+"""
+
+def render_overview_details(project):
+    """Fill OVERVIEW_TEMPLATE for a project, escaping its free-text fields"""
+    volume_mm3, volume_cm3, volume_in3 = calculate_volume(project['weight'], project['weight_unit'])
+    box = OVERVIEW_BOX_TEMPLATE.format_map(project) if project.get('box_volume_mm3', 0) > 0 else ''
+    return OVERVIEW_TEMPLATE.format_map({
+        **project,
+        # Escaped, with line breaks as <br> so a blank line can't end the HTML block early
+        **{
+            field: html.escape(str(project[field])).replace('\r\n', '\n').replace('\n', '<br>')
+            for field in ('project_name', 'designer', 'contact', 'description')
+        },
+        'date': html.escape(format_date(project['date'])),
+        'volume_mm3': volume_mm3,
+        'volume_cm3': volume_cm3,
+        'volume_in3': volume_in3,
+        'box': box,
+    })
+
 def save_projects():
-    """Save projects to JSON file"""
+    """Save projects to JSON file if they changed since the last save"""
+    if not st.session_state.projects_dirty:
+        return
     try:
-        with open('dva_projects.json', 'w') as f:
-            json.dump(st.session_state.projects, f, indent=2)
+        write_json_atomic(PROJECTS_FILE, st.session_state.projects)
+        st.session_state.projects_dirty = False
     except Exception as e:
         st.error(f"Error saving projects: {str(e)}")
 
@@ -284,99 +581,48 @@ def save_current_project():
     """Save or update current project"""
     
     # Gather all project data
-    # Use stored project_date or current date
-    project_date = st.session_state.get('project_date', datetime.now().date())
-    # Convert date to string if it's a date object
-    if hasattr(project_date, 'strftime'):
-        project_date_str = project_date.strftime('%Y-%m-%d')
-    else:
-        project_date_str = str(project_date)
-    
+    # Use stored project_date or current date; kept as a date object (orjson writes it as YYYY-MM-DD)
     project_data = {
         'project_number': st.session_state.get('current_project_number', st.session_state.project_counter),
-        'project_name': st.session_state.get('project_name', ''),
-        'date': project_date_str,
-        'designer': st.session_state.get('designer', ''),
-        'description': st.session_state.get('project_description', ''),
-        'contact': st.session_state.get('contact_info', ''),
-        # Primary product data
-        'weight': st.session_state.get('primary_weight', 0.0),
-        'weight_unit': st.session_state.get('primary_unit', 'grams'),
-        'primary_volume_mm3': st.session_state.get('primary_volume_mm3', 0.0),
-        # Box data
-        'box_length': st.session_state.get('box_length', 0.0),
-        'box_width': st.session_state.get('box_width', 0.0),
-        'box_height': st.session_state.get('box_height', 0.0),
-        'dimension_unit': st.session_state.get('dimension_unit', 'cm'),
-        'box_result_unit': st.session_state.get('box_result_unit', 'cubic cm'),
-        'box_volume_mm3': st.session_state.get('box_volume_mm3', 0.0),
-        'last_modified': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        'date': st.session_state.get('project_date', datetime.now().date())
     }
+    project_data.update(
+        (field, st.session_state.get(key, default)) for field, (key, default) in PROJECT_FIELDS.items()
+    )
+    project_data['last_modified'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Update existing or add new
-    if st.session_state.current_project_id is not None:
+    idx = st.session_state.project_index.get(st.session_state.current_project_id)
+    if idx is not None:
         # Update existing project
-        for i, p in enumerate(st.session_state.projects):
-            if p['project_number'] == st.session_state.current_project_id:
-                st.session_state.projects[i] = project_data
-                break
+        st.session_state.projects[idx] = project_data
     else:
         # Add new project
+        st.session_state.project_index[project_data['project_number']] = len(st.session_state.projects)
         st.session_state.projects.append(project_data)
         st.session_state.current_project_id = project_data['project_number']
     
+    mark_projects_changed()
     save_projects()
     return True
 
 def load_project(project_number):
     """Load a project's data into the form"""
-    for project in st.session_state.projects:
-        if project['project_number'] == project_number:
-            st.session_state.current_project_id = project_number
-            st.session_state.current_project_number = project['project_number']
-            st.session_state.project_name = project['project_name']
-            # Convert date string to date object
-            try:
-                st.session_state.project_date = datetime.strptime(project['date'], '%Y-%m-%d').date()
-            except:
-                st.session_state.project_date = datetime.now().date()
-            st.session_state.designer = project['designer']
-            st.session_state.project_description = project['description']
-            st.session_state.contact_info = project['contact']
-            st.session_state.primary_weight = project['weight']
-            st.session_state.primary_unit = project['weight_unit']
-            st.session_state.primary_volume_mm3 = project['primary_volume_mm3']
-            st.session_state.box_length = project['box_length']
-            st.session_state.box_width = project['box_width']
-            st.session_state.box_height = project['box_height']
-            st.session_state.dimension_unit = project['dimension_unit']
-            st.session_state.box_result_unit = project['box_result_unit']
-            st.session_state.box_volume_mm3 = project['box_volume_mm3']
-            st.rerun()
-            break
-
-# Create tabs
-tab1, tab2, tab3, tab4 = st.tabs(["🔬 Analyzer", "📁 Project Results", "📋 Primary Results", "⚙️ Primary Data"])
+    idx = st.session_state.project_index.get(project_number)
+    if idx is None:
+        return
+    project = st.session_state.projects[idx]
+    st.session_state.current_project_id = project_number
+    st.session_state.current_project_number = project['project_number']
+    project_date = project['date']
+    st.session_state.project_date = project_date if isinstance(project_date, date) else datetime.now().date()
+    for field, (key, _) in PROJECT_FIELDS.items():
+        st.session_state[key] = project[field]
+    st.rerun()
 
-# TAB 1: Analyzer
-with tab1:
-    # Project Info Section
-    st.markdown("## Project Information")
-    
-    col_new, col_save = st.columns([1, 1])
-    
-    with col_new:
-        if st.button("🆕 New Project", use_container_width=True):
-            create_new_project()
-    
-    with col_save:
-        if st.button("💾 Save Project", use_container_width=True):
-            if save_current_project():
-                st.success("✅ Project saved successfully!")
-                time.sleep(1)
-                st.rerun()
-    
-    # Project info fields
+@st.fragment
+def project_info_section():
+    """Project info fields; reruns on its own so typing doesn't redo the volume math"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -392,7 +638,7 @@ with tab1:
         if 'project_name' not in st.session_state:
             st.session_state.project_name = 'New Project'
         
-        project_name = st.text_input(
+        st.text_input(
             "Project Name",
             placeholder="Enter project name",
             key="project_name"
@@ -419,106 +665,28 @@ with tab1:
         if 'contact_info' not in st.session_state:
             st.session_state.contact_info = 'contact@email.com'
         
-        designer = st.text_input(
+        st.text_input(
             "Designer",
             placeholder="Enter designer name",
             key="designer"
         )
         
-        description = st.text_area(
+        st.text_area(
             "Description",
             placeholder="Enter project description",
             height=100,
             key="project_description"
         )
         
-        contact = st.text_input(
+        st.text_input(
             "Contact Info",
             placeholder="Email or phone",
             key="contact_info"
         )
-    
-    st.markdown("---")
-    
-    st.markdown("## Primary Product Volume Calculator")
-    
-    col1, col2 = st.columns([2, 3])
-    
-    with col1:
-        st.markdown("### Input")
-        
-        # Initialize session state if not present
-        if 'primary_weight' not in st.session_state:
-            st.session_state.primary_weight = 100.0
-        if 'primary_unit' not in st.session_state:
-            st.session_state.primary_unit = 'grams'
-        
-        weight = st.number_input(
-            "Weight of Water",
-            min_value=0.0,
-            step=0.1,
-            format="%.2f",
-            key="primary_weight"
-        )
-        
-        unit = st.selectbox(
-            "Unit",
-            ["grams", "ounces", "pounds", "kilograms"],
-            key="primary_unit"
-        )
-        
-        calculate_btn = st.button("🔬 Calculate Volume", use_container_width=True)
-    
-    with col2:
-        st.markdown("### Results")
-        
-        if calculate_btn or weight:
-            results = calculate_volume(weight, unit)
-            
-            # Store primary volume in session state for later use
-            st.session_state.primary_volume_mm3 = results['mm³']
-            
-            # Display results in columns
-            result_col1, result_col2, result_col3 = st.columns(3)
-            
-            with result_col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #ff6b6b; font-weight: bold; font-size: 1.1rem;">Cubic Millimeters</div>
-                    <div class="result-value" style="color: #ff6b6b;">{results['mm³']:,.2f}</div>
-                    <div class="result-unit">mm³</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with result_col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #4ecdc4; font-weight: bold; font-size: 1.1rem;">Cubic Centimeters</div>
-                    <div class="result-value" style="color: #4ecdc4;">{results['cm³']:,.2f}</div>
-                    <div class="result-unit">cm³</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with result_col3:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div style="color: #95e1d3; font-weight: bold; font-size: 1.1rem;">Cubic Inches</div>
-                    <div class="result-value" style="color: #95e1d3;">{results['in³']:,.3f}</div>
-                    <div class="result-unit">in³</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Conversion reference
-            st.markdown("---")
-            st.markdown("### Conversion Reference")
-            st.info(f"""
-            **1 {unit}** of water equals:
-            - {results['mm³']:,.2f} mm³
-            - {results['cm³']:,.2f} cm³  
-            - {results['in³']:,.3f} in³
-            """)
-    
-    # Secondary Packaging Section
+
+@st.fragment
+def box_section():
+    """Secondary packaging calculator; reruns on its own when box inputs change"""
     st.markdown("---")
     st.markdown("## Secondary Packaging")
     st.markdown("### Box Dimensions Calculator")
@@ -583,29 +751,11 @@ with tab1:
         st.markdown("### Box Volume Results")
         
         if calc_box_btn or (box_length and box_width and box_height):
-            # Convert all dimensions to mm first (base unit)
-            dimension_to_mm = {
-                "mm": 1,
-                "cm": 10,
-                "inches": 25.4,
-                "feet": 304.8
-            }
-            
-            # Calculate volume in mm³
-            length_mm = box_length * dimension_to_mm[dimension_unit]
-            width_mm = box_width * dimension_to_mm[dimension_unit]
-            height_mm = box_height * dimension_to_mm[dimension_unit]
-            
-            box_volume_mm3 = length_mm * width_mm * height_mm
+            # Calculate volume in mm³ (base unit)
+            box_volume_mm3 = last_result('box_result', calculate_box, box_length, box_width, box_height, dimension_unit)
             
             # Convert to requested unit
-            mm3_to_result = {
-                "cubic mm": 1,
-                "cubic cm": 0.001,
-                "cubic inches": 0.000061023744
-            }
-            
-            box_volume_result = box_volume_mm3 * mm3_to_result[result_unit_box]
+            box_volume_result = box_volume_mm3 * MM3_TO_UNIT[result_unit_box]
             
             # Store box volume in session state
             st.session_state.box_volume_mm3 = box_volume_mm3
@@ -633,15 +783,8 @@ with tab1:
                     key="remaining_unit"
                 )
                 
-                # Conversion factors from mm³
-                mm3_to_remaining = {
-                    "cubic mm": 1,
-                    "cubic cm": 0.001,
-                    "cubic inches": 0.000061023744,
-                    "cubic feet": 0.000000035315
-                }
-                
-                remaining_volume_result = remaining_volume_mm3 * mm3_to_remaining[remaining_unit]
+                remaining_factor = MM3_TO_UNIT[remaining_unit]
+                remaining_volume_result = remaining_volume_mm3 * remaining_factor
                 
                 # Calculate Volume Efficiency Percentage
                 if box_volume_mm3 > 0:
@@ -651,61 +794,39 @@ with tab1:
                     volume_efficiency_percentage = 0
                     remaining_space_percentage = 0
                 
-                # Display remaining volume
-                col_a, col_b = st.columns(2)
+                # Determine color based on efficiency
+                band = efficiency_band(volume_efficiency_percentage)
+                eff_color = EFFICIENCY_COLORS[band]
+                eff_status = EFFICIENCY_LEVELS[band]
                 
-                with col_a:
-                    st.markdown(f"""
+                color = "#4caf50" if remaining_volume_result > 0 else "#f44336"
+                remaining_color = "#2196f3" if remaining_space_percentage > 0 else "#f44336"
+                
+                # Box/product volumes, remaining volume and efficiency percentages in one block
+                st.markdown(f"""
+                <div class="metric-row">
                     <div class="metric-card">
                         <div style="color: #66b2ff; font-weight: bold; font-size: 1rem;">Box Volume</div>
                         <div style="font-size: 1.5rem; font-weight: bold; color: #66b2ff; margin: 10px 0;">
-                            {box_volume_mm3 * mm3_to_remaining[remaining_unit]:,.2f}
+                            {box_volume_mm3 * remaining_factor:,.2f}
                         </div>
                         <div class="result-unit">{remaining_unit}</div>
                     </div>
-                    """, unsafe_allow_html=True)
-                
-                with col_b:
-                    st.markdown(f"""
                     <div class="metric-card">
                         <div style="color: #ab47bc; font-weight: bold; font-size: 1rem;">Product Volume</div>
                         <div style="font-size: 1.5rem; font-weight: bold; color: #ab47bc; margin: 10px 0;">
-                            {st.session_state.primary_volume_mm3 * mm3_to_remaining[remaining_unit]:,.2f}
+                            {st.session_state.primary_volume_mm3 * remaining_factor:,.2f}
                         </div>
                         <div class="result-unit">{remaining_unit}</div>
                     </div>
-                    """, unsafe_allow_html=True)
-                
-                # Remaining volume
-                color = "#4caf50" if remaining_volume_result > 0 else "#f44336"
-                st.markdown(f"""
+                </div>
                 <div class="metric-card" style="border-color: {color};">
                     <div style="color: {color}; font-weight: bold; font-size: 1.2rem;">Remaining Volume</div>
                     <div class="result-value" style="color: {color};">{remaining_volume_result:,.2f}</div>
                     <div class="result-unit">{remaining_unit}</div>
                 </div>
-                """, unsafe_allow_html=True)
-                
-                # Volume Efficiency Percentage
-                st.markdown("---")
-                col_eff1, col_eff2 = st.columns(2)
-                
-                with col_eff1:
-                    # Determine color based on efficiency
-                    if volume_efficiency_percentage >= 80:
-                        eff_color = "#4caf50"  # Green - Good efficiency
-                        eff_status = "Excellent"
-                    elif volume_efficiency_percentage >= 60:
-                        eff_color = "#8bc34a"  # Light green - Acceptable
-                        eff_status = "Good"
-                    elif volume_efficiency_percentage >= 40:
-                        eff_color = "#ffc107"  # Yellow - Moderate
-                        eff_status = "Moderate"
-                    else:
-                        eff_color = "#ff9800"  # Orange - Low efficiency
-                        eff_status = "Low"
-                    
-                    st.markdown(f"""
+                <hr>
+                <div class="metric-row">
                     <div class="metric-card" style="border-color: {eff_color};">
                         <div style="color: {eff_color}; font-weight: bold; font-size: 1.2rem;">Volume Efficiency</div>
                         <div style="font-size: 2.5rem; font-weight: bold; color: {eff_color}; margin: 10px 0;">
@@ -713,12 +834,6 @@ with tab1:
                         </div>
                         <div class="result-unit">Space Utilization - {eff_status}</div>
                     </div>
-                    """, unsafe_allow_html=True)
-                
-                with col_eff2:
-                    # Remaining space percentage
-                    remaining_color = "#2196f3" if remaining_space_percentage > 0 else "#f44336"
-                    st.markdown(f"""
                     <div class="metric-card" style="border-color: {remaining_color};">
                         <div style="color: {remaining_color}; font-weight: bold; font-size: 1.2rem;">Remaining Space</div>
                         <div style="font-size: 2.5rem; font-weight: bold; color: {remaining_color}; margin: 10px 0;">
@@ -726,7 +841,8 @@ with tab1:
                         </div>
                         <div class="result-unit">Available Capacity</div>
                     </div>
-                    """, unsafe_allow_html=True)
+                </div>
+                """, unsafe_allow_html=True)
                 
                 # Status messages
                 if remaining_volume_result < 0:
@@ -736,6 +852,170 @@ with tab1:
             else:
                 st.info("💡 Calculate the Primary Product Volume first to see remaining space analysis")
 
+@st.fragment
+def render_comparison(projects_with_boxes):
+    """Remaining volume comparison; reruns on its own when the comparison unit changes"""
+    comparison_unit = st.selectbox(
+        "Select unit for comparison:",
+        ["cubic mm", "cubic cm", "cubic inches", "cubic feet"],
+        key="comparison_unit_select"
+    )
+    
+    conversion_factor = MM3_TO_UNIT[comparison_unit]
+    
+    # Columns: box, product and remaining volume in mm³, one row per project
+    volumes_mm3 = np.array(
+        [(p['box_volume_mm3'], p['primary_volume_mm3']) for p in projects_with_boxes],
+        dtype=float
+    )
+    box_mm3 = volumes_mm3[:, 0]
+    volumes_mm3 = np.column_stack((volumes_mm3, box_mm3 - volumes_mm3[:, 1]))
+    
+    # Convert to selected unit
+    converted = volumes_mm3 * conversion_factor
+    
+    # Calculate used/remaining percentages of box volume (0 where the box has no volume)
+    percentages = np.divide(
+        volumes_mm3[:, 1:], box_mm3[:, np.newaxis],
+        out=np.zeros((len(box_mm3), 2)), where=box_mm3[:, np.newaxis] > 0
+    ) * 100
+    percentage_used = percentages[:, 0]
+    
+    # Summary across all compared projects; an overflowing box counts as full, not more
+    average_used = np.minimum(percentage_used, 100).mean()
+    band = efficiency_band(average_used)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Projects Compared", len(projects_with_boxes))
+    with col2:
+        st.metric(
+            "Average Efficiency",
+            f"{average_used:.1f}%",
+            delta=EFFICIENCY_LEVELS[band],
+            delta_color=EFFICIENCY_DELTA_COLORS[band]
+        )
+    with col3:
+        # Overflowing boxes have no free space rather than negative space
+        st.metric("Total Free Space", f"{np.maximum(converted[:, 2], 0).sum():,.2f}")
+        st.caption(comparison_unit)
+    
+    # One table row per project; bands are looked up for the whole batch
+    comparison_df = pd.DataFrame({
+        'Project #': [p['project_number'] for p in projects_with_boxes],
+        'Project Name': [p['project_name'] for p in projects_with_boxes],
+        'Box Volume': converted[:, 0],
+        'Product Volume': converted[:, 1],
+        'Remaining': converted[:, 2],
+        'Efficiency': percentage_used,
+        'Rating': np.take(EFFICIENCY_LEVELS, efficiency_band(percentage_used)),
+        'Status': np.take(SPACE_STATUS, space_band(percentages[:, 1])),
+    })
+    st.dataframe(
+        comparison_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config=COMPARISON_COLUMN_CONFIG
+    )
+    st.caption(f"Volumes in {comparison_unit}")
+
+# Create tabs
+tab1, tab2, tab3, tab4 = st.tabs(["🔬 Analyzer", "📁 Project Results", "📋 Primary Results", "⚙️ Primary Data"])
+
+# TAB 1: Analyzer
+with tab1:
+    # Project Info Section
+    st.markdown("## Project Information")
+    
+    col_new, col_save = st.columns([1, 1])
+    
+    with col_new:
+        if st.button("🆕 New Project", use_container_width=True):
+            create_new_project()
+    
+    with col_save:
+        if st.button("💾 Save Project", use_container_width=True):
+            if save_current_project():
+                # Toasts persist across the rerun, so no need to pause before it
+                st.toast("✅ Project saved successfully!", icon="💾")
+                st.rerun()
+    
+    # Project info fields
+    project_info_section()
+    
+    st.markdown("---")
+    
+    st.markdown("## Primary Product Volume Calculator")
+    
+    col1, col2 = st.columns([2, 3])
+    
+    with col1:
+        st.markdown("### Input")
+        
+        # Initialize session state if not present
+        if 'primary_weight' not in st.session_state:
+            st.session_state.primary_weight = 100.0
+        if 'primary_unit' not in st.session_state:
+            st.session_state.primary_unit = 'grams'
+        
+        weight = st.number_input(
+            "Weight of Water",
+            min_value=0.0,
+            step=0.1,
+            format="%.2f",
+            key="primary_weight"
+        )
+        
+        unit = st.selectbox(
+            "Unit",
+            ["grams", "ounces", "pounds", "kilograms"],
+            key="primary_unit"
+        )
+        
+        calculate_btn = st.button("🔬 Calculate Volume", use_container_width=True)
+    
+    with col2:
+        st.markdown("### Results")
+        
+        if calculate_btn or weight:
+            volume_mm3, volume_cm3, volume_in3 = last_result('primary_result', calculate_volume, weight, unit)
+            
+            # Store primary volume in session state for later use
+            st.session_state.primary_volume_mm3 = volume_mm3
+            
+            # Display results as a single row of cards
+            st.markdown(f"""
+            <div class="metric-row">
+                <div class="metric-card">
+                    <div style="color: #ff6b6b; font-weight: bold; font-size: 1.1rem;">Cubic Millimeters</div>
+                    <div class="result-value" style="color: #ff6b6b;">{volume_mm3:,.2f}</div>
+                    <div class="result-unit">mm³</div>
+                </div>
+                <div class="metric-card">
+                    <div style="color: #4ecdc4; font-weight: bold; font-size: 1.1rem;">Cubic Centimeters</div>
+                    <div class="result-value" style="color: #4ecdc4;">{volume_cm3:,.2f}</div>
+                    <div class="result-unit">cm³</div>
+                </div>
+                <div class="metric-card">
+                    <div style="color: #95e1d3; font-weight: bold; font-size: 1.1rem;">Cubic Inches</div>
+                    <div class="result-value" style="color: #95e1d3;">{volume_in3:,.3f}</div>
+                    <div class="result-unit">in³</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Conversion reference
+            st.markdown("---")
+            st.markdown("### Conversion Reference")
+            st.info(f"""
+            **1 {unit}** of water equals:
+            - {volume_mm3:,.2f} mm³
+            - {volume_cm3:,.2f} cm³  
+            - {volume_in3:,.3f} in³
+            """)
+    
+    # Secondary Packaging Section
+    box_section()
+
 # TAB 2: Project Results
 with tab2:
     st.markdown("## Project Results")
@@ -750,69 +1030,24 @@ with tab2:
         st.markdown("---")
         st.markdown("### Project Summary Table")
         
-        # Initialize selected projects list in session state
-        if 'selected_project_indices' not in st.session_state:
-            st.session_state.selected_project_indices = []
-        
-        # Create columns for checkboxes and table
-        col_select, col_table = st.columns([0.6, 9.4])
+        # Table is rebuilt only after the project list changes
+        if st.session_state.projects_df is None:
+            st.session_state.projects_df = build_project_display(st.session_state.projects)
+        display_df = st.session_state.projects_df
         
-        with col_select:
-            st.markdown("**Select**")
-            # Create checkbox for each project
-            for idx in range(len(st.session_state.projects)):
-                # Use checkbox that can be toggled on/off
-                is_selected = idx in st.session_state.selected_project_indices
-                
-                if st.checkbox("", value=is_selected, key=f"select_project_{idx}", label_visibility="collapsed"):
-                    # Add to selection if not already there
-                    if idx not in st.session_state.selected_project_indices:
-                        st.session_state.selected_project_indices.append(idx)
-                else:
-                    # Remove from selection if it's there
-                    if idx in st.session_state.selected_project_indices:
-                        st.session_state.selected_project_indices.remove(idx)
-        
-        with col_table:
-            # Display project info as table with optimized column widths
-            display_df = []
-            for project in st.session_state.projects:
-                display_df.append({
-                    'Project #': project['project_number'],
-                    'Project Name': project['project_name'],
-                    'Designer': project['designer'],
-                    'Description': project['description'][:50] + '...' if len(project['description']) > 50 else project['description'],
-                    'Date': project['date']
-                })
-            
-            # Display with column configuration for optimized widths
-            st.dataframe(
-                display_df, 
-                use_container_width=True, 
-                hide_index=True,
-                column_config={
-                    "Project #": st.column_config.NumberColumn(
-                        "Project #",
-                        width="small",  # Optimized to fit project number
-                    ),
-                    "Project Name": st.column_config.TextColumn(
-                        "Project Name",
-                        width="medium",
-                    ),
-                    "Designer": st.column_config.TextColumn(
-                        "Designer",
-                        width="small",
-                    ),
-                    "Description": st.column_config.TextColumn(
-                        "Description",
-                        width="large",
-                    ),
-                    "Date": st.column_config.TextColumn(
-                        "Date",
-                        width="small",
-                    ),
-                }
-            )
+        # Display with column configuration for optimized widths; row selection replaces per-project checkboxes
+        project_table = st.dataframe(
+            display_df, 
+            use_container_width=True, 
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="multi-row",
+            key=f"project_table_{st.session_state.projects_version}",
+            column_config=PROJECT_COLUMN_CONFIG
+        )
+        st.session_state.selected_project_indices = [
+            idx for idx in project_table.selection.rows if idx < len(st.session_state.projects)
+        ]
         
         # Show how many projects are selected
         if st.session_state.selected_project_indices:
@@ -827,15 +1062,10 @@ with tab2:
             if st.button("➕ Add Selected to Overview", use_container_width=True):
                 if st.session_state.selected_project_indices:
                     # Add all selected projects to overview
-                    if 'loaded_projects_overview' not in st.session_state:
-                        st.session_state.loaded_projects_overview = []
-                    
-                    added_count = 0
-                    for idx in st.session_state.selected_project_indices:
-                        project = st.session_state.projects[idx]
-                        if not any(p['project_number'] == project['project_number'] for p in st.session_state.loaded_projects_overview):
-                            st.session_state.loaded_projects_overview.append(project)
-                            added_count += 1
+                    added_count = sum(
+                        add_to_overview(st.session_state.projects[idx])
+                        for idx in st.session_state.selected_project_indices
+                    )
                     
                     if added_count > 0:
                         st.success(f"Added {added_count} project(s) to overview")
@@ -848,15 +1078,17 @@ with tab2:
         # Handle Delete button
         if delete_btn:
             if st.session_state.selected_project_indices:
-                # Sort in reverse to delete from end first (avoid index shifting)
-                for idx in sorted(st.session_state.selected_project_indices, reverse=True):
-                    deleted_project = st.session_state.projects[idx]
-                    st.session_state.projects.pop(idx)
-                    st.success(f"✅ Deleted project {deleted_project['project_number']}")
+                selected = set(st.session_state.selected_project_indices)
+                deleted = [st.session_state.projects[idx]['project_number'] for idx in sorted(selected)]
+                st.toast(f"✅ Deleted project(s) {', '.join(map(str, deleted))}", icon="🗑️")
                 
+                # Rebuild the list in one pass instead of popping (and shifting) once per project
+                st.session_state.projects = [
+                    p for i, p in enumerate(st.session_state.projects) if i not in selected
+                ]
+                rebuild_project_index()
+                mark_projects_changed()
                 save_projects()
-                st.session_state.selected_project_indices = []  # Clear selection
-                time.sleep(1)
                 st.rerun()
             else:
                 st.warning("⚠️ Please select at least one project to delete")
@@ -920,7 +1152,7 @@ with tab2:
                         elements.append(Spacer(1, 0.3*inch))
                         
                         # Individual project details
-                        for idx, project in enumerate(st.session_state.loaded_projects_overview):
+                        for idx, project in enumerate(st.session_state.loaded_projects_overview.values()):
                             if idx > 0:
                                 elements.append(PageBreak())
                             
@@ -933,7 +1165,7 @@ with tab2:
                                 ['Project Number:', str(project['project_number'])],
                                 ['Project Name:', project['project_name']],
                                 ['Designer:', project['designer']],
-                                ['Date:', project['date']],
+                                ['Date:', format_date(project['date'])],
                                 ['Contact:', project['contact']],
                                 ['Description:', project['description']]
                             ]
@@ -955,13 +1187,13 @@ with tab2:
                             
                             # Calculation results
                             elements.append(Paragraph("Primary Product Volume", heading_style))
-                            results = calculate_volume(project['weight'], project['weight_unit'])
+                            volume_mm3, volume_cm3, volume_in3 = calculate_volume(project['weight'], project['weight_unit'])
                             
                             calc_data = [
                                 ['Weight:', f"{project['weight']} {project['weight_unit']}"],
-                                ['Volume (mm³):', f"{results['mm³']:,.2f} mm³"],
-                                ['Volume (cm³):', f"{results['cm³']:,.2f} cm³"],
-                                ['Volume (in³):', f"{results['in³']:,.3f} in³"]
+                                ['Volume (mm³):', f"{volume_mm3:,.2f} mm³"],
+                                ['Volume (cm³):', f"{volume_cm3:,.2f} cm³"],
+                                ['Volume (in³):', f"{volume_in3:,.3f} in³"]
                             ]
                             
                             calc_table = Table(calc_data, colWidths=[2*inch, 4.5*inch])
@@ -1012,7 +1244,7 @@ with tab2:
                         
                         # Comparison section if multiple projects
                         if len(st.session_state.loaded_projects_overview) > 1:
-                            projects_with_boxes = [p for p in st.session_state.loaded_projects_overview if p.get('box_volume_mm3', 0) > 0]
+                            projects_with_boxes = list(st.session_state.overview_with_boxes.values())
                             
                             if projects_with_boxes:
                                 elements.append(PageBreak())
@@ -1075,171 +1307,53 @@ with tab2:
                 else:
                     st.warning("⚠️ No projects in overview. Add projects to generate a report.")
         
-        # Initialize overview list
-        if 'loaded_projects_overview' not in st.session_state:
-            st.session_state.loaded_projects_overview = []
-        
         # Display all loaded projects in overview
         if st.session_state.loaded_projects_overview:
-            for idx, project in enumerate(st.session_state.loaded_projects_overview):
-                with st.expander(f"📋 Project {project['project_number']} - {project['project_name']}", expanded=True):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("#### Project Information")
-                        st.info(f"""
-                        **Project Number:** {project['project_number']}  
-                        **Project Name:** {project['project_name']}  
-                        **Designer:** {project['designer']}  
-                        **Date:** {project['date']}  
-                        **Contact:** {project['contact']}  
-                        **Description:** {project['description']}
-                        """)
-                    
-                    with col2:
-                        st.markdown("#### Calculation Results")
-                        
-                        # Primary product volume
-                        results = calculate_volume(project['weight'], project['weight_unit'])
-                        
-                        st.success(f"""
-                        **Primary Product:**  
-                        Weight: {project['weight']} {project['weight_unit']}  
-                        
-                        **Volumes:**  
-                        • {results['mm³']:,.2f} mm³  
-                        • {results['cm³']:,.2f} cm³  
-                        • {results['in³']:,.3f} in³
-                        """)
-                        
-                        # Box volume if available
-                        if project.get('box_volume_mm3', 0) > 0:
-                            st.info(f"""
-                            **Secondary Packaging:**  
-                            Dimensions: {project['box_length']} × {project['box_width']} × {project['box_height']} {project['dimension_unit']}  
-                            Box Volume: {project['box_volume_mm3']:,.2f} mm³
-                            """)
-                    
-                    # Remove button for this project
-                    if st.button(f"Remove from Overview", key=f"remove_overview_{idx}"):
-                        st.session_state.loaded_projects_overview.pop(idx)
-                        st.rerun()
+            # One editable table handles removal instead of a button per project
+            overview_df = pd.DataFrame.from_records(
+                [
+                    (p['project_number'], p['project_name'], p['designer'], format_date(p['date']), False)
+                    for p in st.session_state.loaded_projects_overview.values()
+                ],
+                columns=['Project #', 'Project Name', 'Designer', 'Date', 'Remove']
+            )
+            edited_overview = st.data_editor(
+                overview_df,
+                use_container_width=True,
+                hide_index=True,
+                disabled=['Project #', 'Project Name', 'Designer', 'Date'],
+                column_config=OVERVIEW_COLUMN_CONFIG,
+                key="overview_editor"
+            )
+            
+            to_drop = edited_overview.loc[edited_overview['Remove'], 'Project #']
+            if not to_drop.empty:
+                for project_number in to_drop:
+                    remove_from_overview(project_number)
+                del st.session_state.overview_editor  # Reset edits so they don't apply to shifted rows
+                st.rerun()
+            
+            for project in st.session_state.loaded_projects_overview.values():
+                details_key = f"overview_details_{project['project_number']}"
+                with st.expander(f"📋 Project {project['project_number']} - {project['project_name']}", expanded=st.session_state.get(details_key, False)):
+                    # Details are only rendered once opened, so collapsed panels stay cheap
+                    if st.checkbox("Show details", key=details_key):
+                        st.markdown(render_overview_details(project), unsafe_allow_html=True)
             
             # Clear all button
             if st.button("🗑️ Clear All from Overview"):
-                st.session_state.loaded_projects_overview = []
+                clear_overview()
                 st.rerun()
             
             # Comparison Section - Remaining Volume Analysis
             st.markdown("---")
             st.markdown("## Remaining Volume Comparison")
             
-            # Filter projects that have box volume data
-            projects_with_boxes = [p for p in st.session_state.loaded_projects_overview if p.get('box_volume_mm3', 0) > 0]
+            # Projects that have box volume data (maintained alongside the overview)
+            projects_with_boxes = list(st.session_state.overview_with_boxes.values())
             
             if projects_with_boxes:
-                comparison_unit = st.selectbox(
-                    "Select unit for comparison:",
-                    ["cubic mm", "cubic cm", "cubic inches", "cubic feet"],
-                    key="comparison_unit_select"
-                )
-                
-                # Conversion factors from mm³
-                mm3_to_unit = {
-                    "cubic mm": 1,
-                    "cubic cm": 0.001,
-                    "cubic inches": 0.000061023744,
-                    "cubic feet": 0.000000035315
-                }
-                
-                conversion_factor = mm3_to_unit[comparison_unit]
-                
-                for project in projects_with_boxes:
-                    box_volume_mm3 = project['box_volume_mm3']
-                    product_volume_mm3 = project['primary_volume_mm3']
-                    remaining_volume_mm3 = box_volume_mm3 - product_volume_mm3
-                    
-                    # Convert to selected unit
-                    box_volume = box_volume_mm3 * conversion_factor
-                    product_volume = product_volume_mm3 * conversion_factor
-                    remaining_volume = remaining_volume_mm3 * conversion_factor
-                    
-                    # Calculate percentage
-                    if box_volume_mm3 > 0:
-                        percentage_remaining = (remaining_volume_mm3 / box_volume_mm3) * 100
-                        percentage_used = (product_volume_mm3 / box_volume_mm3) * 100
-                    else:
-                        percentage_remaining = 0
-                        percentage_used = 0
-                    
-                    # Display comparison card
-                    with st.container():
-                        st.markdown(f"### {project['project_name']}")
-                        
-                        col1, col2, col3, col4, col5 = st.columns(5)
-                        
-                        with col1:
-                            st.metric(
-                                "Box Volume",
-                                f"{box_volume:,.2f}",
-                                delta=None
-                            )
-                            st.caption(comparison_unit)
-                        
-                        with col2:
-                            st.metric(
-                                "Product Volume",
-                                f"{product_volume:,.2f}",
-                                delta=f"{percentage_used:.1f}% used"
-                            )
-                            st.caption(comparison_unit)
-                        
-                        with col3:
-                            st.metric(
-                                "Remaining Volume",
-                                f"{remaining_volume:,.2f}",
-                                delta=f"{percentage_remaining:.1f}% free" if remaining_volume >= 0 else "Overflow!"
-                            )
-                            st.caption(comparison_unit)
-                        
-                        with col4:
-                            # Volume Efficiency Percentage
-                            if percentage_used >= 80:
-                                eff_delta = "Excellent"
-                                eff_color = "normal"
-                            elif percentage_used >= 60:
-                                eff_delta = "Good"
-                                eff_color = "normal"
-                            elif percentage_used >= 40:
-                                eff_delta = "Moderate"
-                                eff_color = "off"
-                            else:
-                                eff_delta = "Low"
-                                eff_color = "inverse"
-                            
-                            st.metric(
-                                "Volume Efficiency",
-                                f"{percentage_used:.1f}%",
-                                delta=eff_delta,
-                                delta_color=eff_color
-                            )
-                            st.caption("Space Utilization")
-                        
-                        with col5:
-                            # Visual indicator
-                            if percentage_remaining >= 20:
-                                st.success("✅ Good Space")
-                            elif percentage_remaining >= 5:
-                                st.warning("⚠️ Tight Fit")
-                            else:
-                                st.error("❌ Too Full")
-                        
-                        # Progress bar
-                        if box_volume_mm3 > 0:
-                            st.progress(min(percentage_used / 100, 1.0))
-                            st.caption(f"Space Utilization: {percentage_used:.1f}% | Remaining: {percentage_remaining:.1f}%")
-                        
-                        st.markdown("---")
+                render_comparison(projects_with_boxes)
             else:
                 st.info("💡 No projects with box volume data in overview. Add projects with complete calculations to see comparison.")
         else:
@@ -1253,23 +1367,23 @@ with tab3:
     st.markdown("## Primary Results - Batch Conversion Results")
     
     if st.button("🔄 Refresh Results"):
-        st.session_state.samples = load_data()
+        st.session_state.samples = load_data(DATA_FILE, file_mtime(DATA_FILE))
         st.rerun()
     
     if st.session_state.samples:
         # Create results table
-        results_data = []
+        samples_df = pd.DataFrame.from_records(st.session_state.samples, columns=['id', 'weight', 'unit'])
+        volumes = calculate_volumes_batch(samples_df['weight'], samples_df['unit'])
         
-        for sample in st.session_state.samples:
-            volumes = calculate_volume(sample['weight'], sample['unit'])
-            results_data.append({
-                'Sample ID': sample['id'],
-                'Weight': f"{sample['weight']:.2f}",
-                'Unit': sample['unit'],
-                'Volume (mm³)': f"{volumes['mm³']:,.2f}",
-                'Volume (cm³)': f"{volumes['cm³']:,.2f}",
-                'Volume (in³)': f"{volumes['in³']:,.3f}"
-            })
+        # Column-wise formatting instead of building one dict per sample
+        results_data = pd.DataFrame({
+            'Sample ID': samples_df['id'],
+            'Weight': samples_df['weight'].map('{:.2f}'.format),
+            'Unit': samples_df['unit'],
+            'Volume (mm³)': pd.Series(volumes[:, 0]).map('{:,.2f}'.format),
+            'Volume (cm³)': pd.Series(volumes[:, 1]).map('{:,.2f}'.format),
+            'Volume (in³)': pd.Series(volumes[:, 2]).map('{:,.3f}'.format)
+        }).convert_dtypes(dtype_backend='pyarrow')
         
         # Display as dataframe
         st.dataframe(
@@ -1295,7 +1409,6 @@ with tab4:
     
     if uploaded_file is not None:
         try:
-            import pandas as pd
             df = pd.read_csv(uploaded_file)
             
             # Expected column names (case-insensitive)
@@ -1311,38 +1424,28 @@ with tab4:
                 st.dataframe(df.head(), use_container_width=True)
                 
                 if st.button("📥 Import These Samples", use_container_width=True):
-                    imported_count = 0
-                    skipped_count = 0
+                    # Normalize and validate whole columns at once
+                    candidates = pd.DataFrame({
+                        'id': df['sample id'].astype(str).str.strip(),
+                        'weight': pd.to_numeric(df['weight'], errors='coerce'),
+                        'unit': df['unit'].astype(str).str.lower().str.strip()
+                    })
+                    valid = candidates['unit'].isin(list(VOLUME_CONVERSIONS)) & candidates['weight'].notna()
                     
-                    for _, row in df.iterrows():
-                        sample_id = str(row['sample id']).strip()
-                        
-                        # Skip if ID already exists
-                        if any(s['id'] == sample_id for s in st.session_state.samples):
-                            skipped_count += 1
-                            continue
-                        
-                        # Validate unit
-                        unit = str(row['unit']).lower().strip()
-                        if unit not in ['grams', 'ounces', 'pounds', 'kilograms']:
-                            skipped_count += 1
-                            continue
-                        
-                        try:
-                            weight = float(row['weight'])
-                            st.session_state.samples.append({
-                                'id': sample_id,
-                                'weight': weight,
-                                'unit': unit
-                            })
-                            imported_count += 1
-                        except (ValueError, TypeError):
-                            skipped_count += 1
-                            continue
+                    # Skip IDs that already exist or repeat earlier rows in the file
+                    existing_ids = {s['id'] for s in st.session_state.samples}
+                    candidates = candidates[valid & ~candidates['id'].isin(existing_ids)].drop_duplicates('id')
+                    
+                    new_samples = [
+                        {'id': sample_id, 'weight': float(weight), 'unit': unit}
+                        for sample_id, weight, unit in candidates.itertuples(index=False)
+                    ]
+                    st.session_state.samples.extend(new_samples)
+                    imported_count = len(new_samples)
+                    skipped_count = len(df) - imported_count
                     
                     save_data(st.session_state.samples)
-                    st.success(f"✅ Imported {imported_count} samples! Skipped {skipped_count} (duplicates or invalid data).")
-                    time.sleep(1.5)
+                    st.toast(f"✅ Imported {imported_count} samples! Skipped {skipped_count} (duplicates or invalid data).", icon="📥")
                     st.rerun()
             else:
                 st.error(f"❌ Invalid CSV format. Expected columns: 'Sample ID', 'Weight', 'Unit'. Found: {', '.join(df.columns)}")
@@ -1376,8 +1479,7 @@ with tab4:
                             'unit': new_unit
                         })
                         save_data(st.session_state.samples)
-                        st.success(f"✅ Sample '{new_id}' added successfully!")
-                        time.sleep(1)
+                        st.toast(f"✅ Sample '{new_id}' added successfully!", icon="➕")
                         st.rerun()
                 else:
                     st.error("Please enter a Sample ID")
@@ -1388,8 +1490,17 @@ with tab4:
         if st.session_state.samples:
             st.markdown(f"**Total: {len(st.session_state.samples)} samples**")
             
+            # Paginate so only one page of delete buttons is rendered per run
+            page_count = math.ceil(len(st.session_state.samples) / SAMPLES_PAGE_SIZE)
+            if st.session_state.get('samples_page', 1) > page_count:
+                st.session_state.samples_page = page_count
+            page = 1
+            if page_count > 1:
+                page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="samples_page")
+            start = (page - 1) * SAMPLES_PAGE_SIZE
+            
             # Display samples with delete option
-            for idx, sample in enumerate(st.session_state.samples):
+            for idx, sample in enumerate(st.session_state.samples[start:start + SAMPLES_PAGE_SIZE], start=start):
                 col_a, col_b = st.columns([4, 1])
                 
                 with col_a:
@@ -1399,8 +1510,7 @@ with tab4:
                     if st.button("🗑️", key=f"delete_{idx}"):
                         st.session_state.samples.pop(idx)
                         save_data(st.session_state.samples)
-                        st.success(f"Deleted {sample['id']}")
-                        time.sleep(0.5)
+                        st.toast(f"Deleted {sample['id']}", icon="🗑️")
                         st.rerun()
         else:
             st.info("No samples yet. Add your first sample!")